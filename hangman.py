@@ -1,57 +1,65 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import io
+import os
 import random
+import re
 import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
+from typing import Iterable, Sequence
 
 
 # -----------------------------
 # Hangman frames (EMPTY -> FULL)
 # -----------------------------
-FIGURES: list[str] = list(reversed([
+FIGURES: tuple[str, ...] = tuple(f.rstrip("\n") for f in (
+    """
+\n\n\n\n\n
+##########""",
     r"""
--+---+-
- |/  O
- |  /|\
- |  / \
  |
-/|\
+ |
+ |
+ |
+ |
+ |
 ##########
 """,
     r"""
--+---+-
- |/  O
- |  /|\
- |  /
  |
-/|\
+ |
+ |
+ |
+ |
+/|
 ##########
 """,
     r"""
--+---+-
- |/  O
- |  /|\
+ |
+ |
+ |
  |
  |
 /|\
 ##########
 """,
     r"""
--+---+-
- |/  O
- |  /|
+-+-----
+ |
+ |
  |
  |
 /|\
 ##########
 """,
     r"""
--+---+-
- |/  O
- |   |
+-+-----
+ |/
+ |
  |
  |
 /|\
@@ -67,76 +75,117 @@ FIGURES: list[str] = list(reversed([
 ##########
 """,
     r"""
--+-----
- |/
- |
+-+---+-
+ |/  O
+ |   |
  |
  |
 /|\
 ##########
 """,
     r"""
--+-----
- |
- |
+-+---+-
+ |/  O
+ |  /|
  |
  |
 /|\
 ##########
 """,
     r"""
- |
- |
- |
+-+---+-
+ |/  O
+ |  /|\
  |
  |
 /|\
 ##########
 """,
     r"""
+-+---+-
+ |/  O
+ |  /|\
+ |  /
  |
- |
- |
- |
- |
-/|
+/|\
 ##########
 """,
     r"""
+-+---+-
+ |/  O
+ |  /|\
+ |  / \
  |
- |
- |
- |
- |
- |
+/|\
 ##########
 """,
-    """
-\n\n\n\n\n
-##########""",
-]))
+))
+_FRAME_HEIGHT = max(len(f.splitlines()) for f in FIGURES)
 
 
 # -----------------------------
 # Terminal rendering
 # -----------------------------
+@functools.lru_cache(maxsize=None)
+def _ascii_compatible(encoding: str | None) -> bool:
+    """True if encoding writes ASCII text (frames, escape codes) byte for byte."""
+    if not encoding:
+        return False
+    try:
+        return "\x1b[J\n#".encode(encoding) == b"\x1b[J\n#"
+    except LookupError:
+        return False
+
+
 class Terminal:
     def __init__(self, frames: Sequence[str]) -> None:
         self.frames = [f.rstrip("\n") for f in frames]
-        self.h = max(len(f.splitlines()) for f in self.frames) if self.frames else 0
+        if frames is FIGURES:
+            self.h = _FRAME_HEIGHT  # measured once at import time
+        else:
+            self.h = max(len(f.splitlines()) for f in self.frames) if self.frames else 0
+        # frames never change, so pad them to full height once up front
+        self._padded = [self._pad(f) for f in self.frames]
+        self._cursor_up = f"\x1b[{self.h}F" if self.h else ""
+        # ASCII frames can skip the text encoder and go straight to the binary buffer,
+        # but only where the text layer would not translate "\n" (i.e. not on Windows)
+        self._padded_bytes: list[bytes] | None = None
+        if os.linesep == "\n":
+            try:
+                self._padded_bytes = [p.encode("ascii") for p in self._padded]
+            except UnicodeEncodeError:
+                pass
+        self._cursor_up_bytes = self._cursor_up.encode("ascii")
         self._first_draw = True
 
     def _pad(self, frame: str) -> str:
         lines = frame.splitlines()
         return "\n".join(lines + [""] * (self.h - len(lines))) + "\n"
 
-    def draw(self, idx: int) -> None:
+    def draw(self, idx: int, footer: str = "") -> None:
+        """Redraws frame idx followed by footer, with a single flush."""
         idx = max(0, min(idx, len(self.frames) - 1))
-        if not self._first_draw and self.h:
-            sys.stdout.write(f"\x1b[{self.h}F")  # cursor up
-        self._first_draw = False
-        sys.stdout.write("\x1b[J")  # clear to end of screen
-        sys.stdout.write(self._pad(self.frames[idx]))
+        first, self._first_draw = self._first_draw, False
+        buf = getattr(sys.stdout, "buffer", None)
+        if (
+            self._padded_bytes is None
+            # unbuffered (python -u) FileIO would split frame and footer into
+            # separate, unchecked os.write calls
+            or not isinstance(buf, io.BufferedWriter)
+            or not _ascii_compatible(sys.stdout.encoding)
+        ):
+            # text-only stdout (e.g. some IDE consoles), non-ASCII frames or Windows,
+            # unbuffered stdout, or an encoding like UTF-16 the raw frame bytes don't match
+            prefix = "" if first else self._cursor_up  # cursor up
+            sys.stdout.write(prefix + "\x1b[J" + self._padded[idx] + footer)  # clear + frame
+            sys.stdout.flush()
+            return
+        prefix_b = b"" if first else self._cursor_up_bytes  # cursor up
+        sys.stdout.flush()  # keep ordering with anything still in the text layer
+        buf.write(prefix_b + b"\x1b[J" + self._padded_bytes[idx])  # clear + frame
+        # footer is arbitrary text (umlauts, emoji), so leave it to the text layer;
+        # its flush pushes frame and footer out of the buffer together
+        sys.stdout.write(footer)
         sys.stdout.flush()
 
 
@@ -145,22 +194,31 @@ class Terminal:
 # ä/ö/ü -> ae/oe/ue, ß -> ss
 # also accept "sz" as guess alias for ß
 # -----------------------------
+# casefold() already folds ß/ẞ -> ss, so only the umlauts need a table
+_DE_TRANS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+
+# guess aliases for umlauts/ß -> letters of the normalized word they reveal
+# ("ss" after normalization, so 's' is enough for ß)
+_ALIAS: dict[str, tuple[str, ...]] = {
+    "ä": ("a", "e"), "ae": ("a", "e"),
+    "ö": ("o", "e"), "oe": ("o", "e"),
+    "ü": ("u", "e"), "ue": ("u", "e"),
+    "ß": ("s",), "ss": ("s",), "sz": ("s",),
+}
+
+
+def _normalize_casefolded(cf: str) -> str:
+    # for input that has already been through casefold()
+    return cf.translate(_DE_TRANS)
+
+
+@functools.lru_cache(maxsize=2048)
 def normalize_word_de(s: str) -> str:
     # casefold handles German casing more robustly than lower()
-    s = s.casefold()
-    out: list[str] = []
-    for ch in s:
-        if ch == "ä":
-            out.append("ae")
-        elif ch == "ö":
-            out.append("oe")
-        elif ch == "ü":
-            out.append("ue")
-        elif ch == "ß":
-            out.append("ss")
-        else:
-            out.append(ch)
-    return "".join(out)
+    return _normalize_casefolded(s.casefold())
+
+
+_WHITESPACE = re.compile(r"\s")
 
 
 def load_words(path: Path | None) -> list[str]:
@@ -169,32 +227,37 @@ def load_words(path: Path | None) -> list[str]:
     if not path.exists():
         raise FileNotFoundError(f"Wortliste nicht gefunden: {path}")
 
-    words: list[str] = []
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        w = line.strip()
-        if not w or any(c.isspace() for c in w):
-            continue
-        words.append(w)
-    return words
+    # stream line by line instead of holding the whole file plus its split copy;
+    # splitlines() per line keeps the old separators (\v, \f, \x1c-\x1e, \x85, \u2028/9)
+    # that file iteration alone does not split on
+    with path.open("r", encoding="utf-8", errors="ignore") as f:
+        return [
+            w
+            for line in f
+            for part in line.splitlines()
+            if (w := part.strip()) and not _WHITESPACE.search(w)
+        ]
+
+
+# fallback when no word list is given
+_DEFAULT_WORDS: tuple[str, ...] = (
+    "Überraschung",
+    "Straßenbahn",
+    "Wörterbuch",
+    "Programmieren",
+    "KünstlicheIntelligenz",
+    "größer",
+)
 
 
 def pick_word(words: Sequence[str]) -> str:
-    if not words:
-        words = [
-            "Überraschung",
-            "Straßenbahn",
-            "Wörterbuch",
-            "Programmieren",
-            "KünstlicheIntelligenz",
-            "größer",
-        ]
-    return random.choice(words)
+    return random.choice(words or _DEFAULT_WORDS)
 
 
 # -----------------------------
 # Game model
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class HangmanGame:
     original_word: str
     max_wrong: int
@@ -206,48 +269,71 @@ class HangmanGame:
     # derived
     word: str = field(init=False)          # normalized playable word (ae/oe/ue/ss)
     has_eszett: bool = field(init=False)
+    _letters: frozenset[str] = field(init=False, repr=False)  # distinct letters of word
+    _wrong_sorted: list[str] = field(init=False, repr=False)  # self.wrong, kept sorted
+    _mask_table: dict[int, str] | None = field(init=False, repr=False)  # None = stale
+    _dirty: bool = field(init=False, repr=False)  # state changed since last render
 
     def __post_init__(self) -> None:
         if self.max_wrong < 1:
             raise ValueError("max_wrong muss >= 1 sein")
-        self.has_eszett = "ß" in self.original_word.casefold()
-        self.word = normalize_word_de(self.original_word)
+        # casefold() turns ß/ẞ into "ss", so look for them before folding
+        self.has_eszett = "ß" in self.original_word or "ẞ" in self.original_word
+        self.word = _normalize_casefolded(self.original_word.casefold())
+        self._letters = frozenset(c for c in self.word if c.isalpha())
+        self._wrong_sorted = sorted(self.wrong)
+        self._mask_table = None
+        self._dirty = True
 
     @property
     def wrong_count(self) -> int:
         return len(self.wrong)
 
+    @property
+    def wrong_sorted(self) -> Sequence[str]:
+        """Wrong guesses in sorted order (read-only view, kept up to date per guess)."""
+        return self._wrong_sorted
+
     @property
     def is_won(self) -> bool:
-        needed = {c for c in self.word if c.isalpha()}
-        return needed.issubset(self.guessed)
+        return self._letters.issubset(self.guessed)
 
     @property
     def is_lost(self) -> bool:
         return self.wrong_count >= self.max_wrong
 
+    def take_dirty(self) -> bool:
+        """Returns True if the state changed since the last call, and resets the flag."""
+        dirty, self._dirty = self._dirty, False
+        return dirty
+
     def masked_word(self) -> str:
-        out: list[str] = []
-        for c in self.word:
-            if c.isalpha():
-                out.append(c if c in self.guessed else "_")
-            else:
-                out.append(c)
-        return " ".join(out)
+        if self._mask_table is None:
+            self._mask_table = {ord(c): "_" for c in self._letters - self.guessed}
+        return " ".join(self.word.translate(self._mask_table))
+
+    def _add_guessed(self, letters: Iterable[str]) -> None:
+        self.guessed.update(letters)
+        self._mask_table = None
+        self._dirty = True
+
+    def _add_wrong(self, x: str) -> None:
+        if x not in self.wrong:
+            self.wrong.add(x)
+            bisect.insort(self._wrong_sorted, x)
+            self._dirty = True
 
     def _apply_guess_letters(self, letters: Sequence[str]) -> bool:
         """Returns True if at least one new guess was applied."""
-        changed = False
-        for ch in letters:
-            if ch in self.guessed or ch in self.wrong:
-                continue
-            if ch in {c for c in self.word if c.isalpha()}:
-                self.guessed.add(ch)
-                changed = True
-            else:
-                self.wrong.add(ch)
-                changed = True
-        return changed
+        new = set(letters) - self.guessed - self.wrong
+        if not new:
+            return False
+        hits = new & self._letters
+        if hits:
+            self._add_guessed(hits)
+        for ch in new - hits:
+            self._add_wrong(ch)
+        return True
 
     def guess(self, raw: str) -> tuple[bool, str]:
         raw = raw.strip()
@@ -258,54 +344,49 @@ class HangmanGame:
 
         # full word guess (optional, but nice)
         if len(g) > 2 and g.isalpha():
-            if normalize_word_de(g) == self.word:
-                self.guessed.update({c for c in self.word if c.isalpha()})
+            # g is already casefolded: plain ASCII needs no further normalization
+            candidate = g if g.isascii() else normalize_word_de(g)
+            if candidate == self.word:
+                self._add_guessed(self._letters)
                 return True, "Wort erraten ✅"
-            self.wrong.add(g)  # track it, counts as one wrong attempt (string ok)
+            if g in self.wrong:
+                return False, f"'{raw}' hattest du schon."
+            self._add_wrong(g)  # track it, counts as one wrong attempt (string ok)
             return True, "Nope ❌"
 
         # special aliases for umlauts/ß
         # You can input: ä/ae, ö/oe, ü/ue, ß/ss/sz
-        if g in {"ä", "ae"}:
-            letters = ["a", "e"]
-        elif g in {"ö", "oe"}:
-            letters = ["o", "e"]
-        elif g in {"ü", "ue"}:
-            letters = ["u", "e"]
-        elif g in {"ß", "ss", "sz"}:
-            letters = ["s"]  # word contains "ss" after normalization, so 's' is enough
-        elif g == "z" and self.has_eszett:
-            # allow "sz" idea: if original had ß, accept z as alias to help the player
-            letters = ["s"]
-        else:
-            # regular single-letter guess
-            g = g[0]
-            if not g.isalpha():
-                return False, "Nur Buchstaben bitte 🙂"
-            letters = [g]
+        letters = _ALIAS.get(g)
+        if letters is None:
+            if g == "z" and self.has_eszett:
+                # allow "sz" idea: if original had ß, accept z as alias to help the player
+                letters = ("s",)
+            else:
+                # regular single-letter guess
+                ch = g[0]
+                if not ch.isalpha():
+                    return False, "Nur Buchstaben bitte 🙂"
+                letters = (ch,)
 
         # prevent "double guess" noise
-        if all((ch in self.guessed or ch in self.wrong) for ch in letters):
+        if not set(letters) - self.guessed - self.wrong:
             return False, f"'{raw}' hattest du schon."
 
         # apply: for multi-letter (ae/oe/ue) we reveal both letters in one move
         # but wrong attempts should count as ONE move, not per letter
         # => if at least one letter hits, ok; otherwise mark a single wrong token
-        target_letters = {c for c in self.word if c.isalpha()}
-        hit = any(ch in target_letters for ch in letters)
+        hits = self._letters.intersection(letters)
 
-        if hit:
-            for ch in letters:
-                if ch in target_letters:
-                    self.guessed.add(ch)
+        if hits:
+            self._add_guessed(hits)
             return True, "Treffer ✅"
         else:
-            self.wrong.add(raw.casefold())
+            self._add_wrong(g)
             return True, "Leider daneben ❌"
 
 
 def format_status(game: HangmanGame) -> str:
-    wrong_sorted = " ".join(sorted(str(x) for x in game.wrong)) if game.wrong else "-"
+    wrong_sorted = " ".join(game.wrong_sorted) or "-"
     remaining = game.max_wrong - game.wrong_count
     return (
         f"Wort:   {game.masked_word()}\n"
@@ -323,9 +404,9 @@ def run_hangman(words: Sequence[str], frames: Sequence[str] = FIGURES) -> int:
     term = Terminal(frames)
 
     while not (game.is_won or game.is_lost):
-        term.draw(game.wrong_count)
-        sys.stdout.write("\n" + format_status(game))
-        sys.stdout.flush()
+        # only redraw after a guess actually changed the game
+        if game.take_dirty():
+            term.draw(game.wrong_count, "\n" + format_status(game))
 
         try:
             raw = input("Rate (Buchstabe / ae/oe/ue / ss/sz): ")
@@ -338,17 +419,15 @@ def run_hangman(words: Sequence[str], frames: Sequence[str] = FIGURES) -> int:
             sys.stdout.write(msg + "\n")
             sys.stdout.flush()
 
-    term.draw(game.wrong_count)
-    sys.stdout.write("\n" + format_status(game))
-
     if game.is_won:
-        sys.stdout.write(f"🎉 Gewonnen! Lösung (normalisiert): {game.word}\n")
-        sys.stdout.write(f"   Original: {game.original_word}\n")
-        return 0
+        result = f"🎉 Gewonnen! Lösung (normalisiert): {game.word}\n"
     else:
-        sys.stdout.write(f"💀 Verloren… Lösung (normalisiert): {game.word}\n")
-        sys.stdout.write(f"   Original: {game.original_word}\n")
-        return 1
+        result = f"💀 Verloren… Lösung (normalisiert): {game.word}\n"
+    term.draw(
+        game.wrong_count,
+        "\n" + format_status(game) + result + f"   Original: {game.original_word}\n",
+    )
+    return 0 if game.is_won else 1
 
 
 def main(argv: list[str]) -> int:
@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from hangman import HangmanGame, format_status, load_words
+
+
+class EszettTest(unittest.TestCase):
+    def test_has_eszett(self) -> None:
+        self.assertTrue(HangmanGame("Straße", 5).has_eszett)
+        self.assertTrue(HangmanGame("STRAẞE", 5).has_eszett)
+        self.assertFalse(HangmanGame("Strasse", 5).has_eszett)
+
+    def test_z_alias_hits_on_eszett(self) -> None:
+        game = HangmanGame("Straße", 5)
+        self.assertEqual(game.guess("z"), (True, "Treffer ✅"))
+        self.assertIn("s", game.guessed)
+        self.assertEqual(game.wrong_count, 0)
+
+    def test_z_without_eszett_is_plain_guess(self) -> None:
+        game = HangmanGame("Strasse", 5)
+        self.assertEqual(game.guess("z"), (True, "Leider daneben ❌"))
+        self.assertEqual(game.wrong, {"z"})
+
+
+class MaskedWordTest(unittest.TestCase):
+    def test_hidden_at_start(self) -> None:
+        self.assertEqual(HangmanGame("Öl-Tank", 5).masked_word(), "_ _ _ - _ _ _ _")
+
+    def test_updates_after_hit(self) -> None:
+        game = HangmanGame("Öl-Tank", 5)
+        game.masked_word()  # build the cached table before guessing
+        game.guess("a")
+        self.assertEqual(game.masked_word(), "_ _ _ - _ a _ _")
+        game.guess("ö")
+        self.assertEqual(game.masked_word(), "o e _ - _ a _ _")
+
+    def test_miss_leaves_mask_unchanged(self) -> None:
+        game = HangmanGame("Haus", 5)
+        game.masked_word()
+        game.guess("x")
+        self.assertEqual(game.masked_word(), "_ _ _ _")
+
+    def test_full_word_win(self) -> None:
+        game = HangmanGame("Größer", 5)
+        game.masked_word()
+        self.assertEqual(game.guess("größer"), (True, "Wort erraten ✅"))
+        self.assertEqual(game.masked_word(), "g r o e s s e r")
+        self.assertTrue(game.is_won)
+
+
+class FormatStatusTest(unittest.TestCase):
+    def test_wrong_guesses_are_sorted(self) -> None:
+        game = HangmanGame("Haus", 5)
+        for raw in ("z", "b", "x", "b"):
+            game.guess(raw)
+        self.assertEqual(list(game.wrong_sorted), ["b", "x", "z"])
+        self.assertIn("Falsch: b x z\n", format_status(game))
+
+    def test_wrong_from_constructor_is_sorted(self) -> None:
+        game = HangmanGame("Haus", 5, wrong={"q", "c"})
+        game.guess("m")
+        self.assertIn("Falsch: c m q\n", format_status(game))
+
+    def test_no_wrong_guesses(self) -> None:
+        self.assertIn("Falsch: -\n", format_status(HangmanGame("Haus", 5)))
+
+
+class TakeDirtyTest(unittest.TestCase):
+    def test_new_game_is_dirty_once(self) -> None:
+        game = HangmanGame("Haus", 5)
+        self.assertTrue(game.take_dirty())
+        self.assertFalse(game.take_dirty())
+
+    def test_hit_and_miss_mark_dirty(self) -> None:
+        game = HangmanGame("Haus", 5)
+        game.take_dirty()
+        game.guess("h")
+        self.assertTrue(game.take_dirty())
+        game.guess("x")
+        self.assertTrue(game.take_dirty())
+
+    def test_rejected_guess_is_not_dirty(self) -> None:
+        game = HangmanGame("Haus", 5)
+        game.take_dirty()
+        self.assertEqual(game.guess("  "), (False, "Bitte eingeben 🙂"))
+        self.assertEqual(game.guess("1"), (False, "Nur Buchstaben bitte 🙂"))
+        self.assertFalse(game.take_dirty())
+
+    def test_repeated_letter_is_not_dirty(self) -> None:
+        game = HangmanGame("Haus", 5)
+        game.guess("x")
+        game.take_dirty()
+        self.assertEqual(game.guess("x"), (False, "'x' hattest du schon."))
+        self.assertFalse(game.take_dirty())
+
+    def test_repeated_wrong_word_is_reported_not_dirty(self) -> None:
+        game = HangmanGame("Haus", 5)
+        self.assertEqual(game.guess("Maus"), (True, "Nope ❌"))
+        game.take_dirty()
+        self.assertEqual(game.guess("Maus"), (False, "'Maus' hattest du schon."))
+        self.assertFalse(game.take_dirty())
+        self.assertEqual(game.wrong_count, 1)
+
+
+class LoadWordsTest(unittest.TestCase):
+    def _load(self, text: str) -> list[str]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "words.txt"
+            path.write_bytes(text.encode("utf-8"))
+            return load_words(path)
+
+    def test_skips_blank_and_multi_word_lines(self) -> None:
+        self.assertEqual(
+            self._load("Haus\r\n  Baum  \n\nzwei worte\ntab\tbed\nStraße\n"),
+            ["Haus", "Baum", "Straße"],
+        )
+
+    def test_splits_on_all_line_boundaries(self) -> None:
+        self.assertEqual(
+            self._load("Foo\x0cBar\vBaz\x1cQux\x85Eins\u2028Zwei\u2029Drei\n"),
+            ["Foo", "Bar", "Baz", "Qux", "Eins", "Zwei", "Drei"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()